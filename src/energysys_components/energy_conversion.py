@@ -1,17 +1,64 @@
 """
 Main conversion class
 """
-from dataclasses import dataclass, field
-from scipy import interpolate
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from operator import attrgetter
+from typing import NamedTuple, Tuple
+import numpy as np
 from energysys_components.various.normalization import denorm
+from energysys_components.various.interpolation import (LinearInterpolator, interp_uniform,
+                                                        interp_scalar)
+from energysys_components.various.jit import njit, prange, NUMBA_AVAILABLE
 from energysys_components.energy_carrier import ECarrier
-import copy
 
 
-@dataclass(frozen=False)
+# Fixed order of state values returned by EnergyConversion._calc_E_change()
+E_CHANGE_FIELDS = ('E_in', 'E_in_mc', 'E_loss', 'E_in_sd1', 'E_in_sd2', 'E_out',
+                   'P_in', 'P_in_mc', 'P_loss', 'P_in_sd1', 'P_in_sd2', 'P_out')
+
+# Fixed order of state values returned by conversion_step() / EnergyConversion._calc_step()
+STEP_FIELDS = ('heatup_pct', 'eta_pct', 'eta_mc_pct') + E_CHANGE_FIELDS + ('E_balance',)
+# Positions of state values required as input of the next step (constants for jit kernels)
+_STEP_I_HEATUP = STEP_FIELDS.index('heatup_pct')
+_STEP_I_P_OUT = STEP_FIELDS.index('P_out')
+_STEP_I_P_IN = STEP_FIELDS.index('P_in')
+_STEP_I_P_IN_MC = STEP_FIELDS.index('P_in_mc')
+
+# Tolerance for comparisons of loads [%-pts]
+TOL_PCT = 1e-9
+
+
+class EConversionScalars(NamedTuple):
+    """
+    Scalar (derived) parameters of energy conversion component, as required by jit-compiled
+    kernels. Created in EConversionParams.__post_init__()
+    """
+    P_out_min_pct: float
+    P_out_rated: float
+    P_out_min: float
+    P_in_min: float
+    P_in_mc_min: float
+    P_in_mc_max: float
+    p_change_st_pct: float
+    p_change_sd_pct: float
+    p_change_pos: float
+    p_change_neg: float
+    E_preparation: float
+    E_preparation_heat: float
+    E_preparation_loss: float
+    eta_preparation: float
+    split_P_sd1: float
+    split_P_sd2: float
+
+
+@dataclass(frozen=True)
 class EConversionParams:
     """
     Definition of energy conversion component
+
+    Parameters are frozen, as derived parameters (interpolators, scalars, ...) are calculated
+    once in __post_init__(). Use dataclasses.replace() to create modified parameter sets.
     """
     name: str
 
@@ -61,6 +108,7 @@ class EConversionParams:
     def __post_init__(self):
         """
         Calculation of helper functions, interpolators, ...
+        Info: Instance is frozen, derived attributes are set with object.__setattr__()
 
         Returns
         -------
@@ -73,10 +121,11 @@ class EConversionParams:
         # heatup/startup increase per time [%/min]
         # Example:  min_load_perc= 5%, preparation_time= 30min
         #           --> preparation_incr =  2.5% / min
-        self.p_change_st_pct = self.P_out_min_pct / self.t_preparation
+        object.__setattr__(self, 'p_change_st_pct', self.P_out_min_pct / self.t_preparation)
 
-        self.E_preparation_heat = self.E_preparation * self.eta_preparation / 100
-        self.E_preparation_loss = self.E_preparation - self.E_preparation_heat
+        object.__setattr__(self, 'E_preparation_heat',
+                           self.E_preparation * self.eta_preparation / 100)
+        object.__setattr__(self, 'E_preparation_loss', self.E_preparation - self.E_preparation_heat)
 
         # Shutdown calculations
         # ---------------------------------------------------------
@@ -84,106 +133,95 @@ class EConversionParams:
         # cool down decrease per time [%/min]
         # Example:  min_load_perc = 5%, cooldown_time= 30min
         #           --> cooldown_decr =  2.5% / min
-        self.p_change_sd_pct = self.P_out_min_pct / self.t_cooldown
+        object.__setattr__(self, 'p_change_sd_pct', self.P_out_min_pct / self.t_cooldown)
 
         # Efficiency calculations - overall component
         # ---------------------------------------------------------
 
         # Interpolator eta(output load [%]) [%]
-        self.eta_pct_ip = interpolate.interp1d(self.eta_pct[0],
-                                               self.eta_pct[1],
-                                               kind='linear',
-                                               bounds_error=False,
-                                               fill_value=(self.eta_pct[1][0],
-                                                           self.eta_pct[1][-1]))
+        object.__setattr__(self, 'eta_pct_ip', LinearInterpolator(self.eta_pct[0], self.eta_pct[1]))
+
+        # Support points output load [%], [kW] and input load [kW] as arrays
+        P_out_pct = np.asarray(self.eta_pct[0], dtype=float)
+        P_out_kW = P_out_pct / 100 * self.P_out_rated
+        P_in_kW = P_out_kW / (self.eta_pct_ip(P_out_pct) / 100)
 
         # Interpolator eta(output load [kW]) [%]
-        self.eta_kW_ip = interpolate.interp1d(
-            [e / 100 * self.P_out_rated for e in self.eta_pct[0]],
-            self.eta_pct[1],
-            kind='linear',
-            bounds_error=False,
-            fill_value=(self.eta_pct[1][0],
-                        self.eta_pct[1][-1]))
+        object.__setattr__(self, 'eta_kW_ip', LinearInterpolator(P_out_kW, self.eta_pct[1]))
 
         # Interpolator eta(input load [kW]) [%]
-        list_P_out_kW = [ol_perc / 100 * self.P_out_rated for ol_perc in self.eta_pct[0]]
-        list_P_in_kW = [ol_perc / 100 * self.P_out_rated /
-                        (self.eta_pct_ip(ol_perc) / 100) for ol_perc in self.eta_pct[0]]
-        list_eta_in_kW = [ol / il * 100 if il != 0 else 0 for ol, il in
-                          zip(list_P_out_kW, list_P_in_kW)]
-
-        self.eta_in_kW_ip = interpolate.interp1d(
-            list_P_in_kW,
-            list_eta_in_kW,
-            kind='linear',
-            bounds_error=False,
-            fill_value=(list_eta_in_kW[0],
-                        list_eta_in_kW[-1]))
+        with np.errstate(invalid='ignore'):
+            eta_in_kW = np.where(P_in_kW != 0, P_out_kW / P_in_kW * 100, 0)
+
+        object.__setattr__(self, 'eta_in_kW_ip', LinearInterpolator(P_in_kW, eta_in_kW))
 
         # Efficiency calculations - main conversion path
         # ---------------------------------------------------------
 
         # Interpolator eta(output load [%]) [%]
-        self.eta_mc_pct_ip = interpolate.interp1d(self.eta_mc_pct[0],
-                                                  self.eta_mc_pct[1],
-                                                  kind='linear',
-                                                  bounds_error=False,
-                                                  fill_value=(self.eta_mc_pct[1][0],
-                                                              self.eta_mc_pct[1][-1]))
+        object.__setattr__(self, 'eta_mc_pct_ip',
+                           LinearInterpolator(self.eta_mc_pct[0], self.eta_mc_pct[1]))
+
+        # Support points output load [%], [kW] and input load [kW] as arrays
+        P_out_pct = np.asarray(self.eta_mc_pct[0], dtype=float)
+        P_out_kW = P_out_pct / 100 * self.P_out_rated
+        P_in_kW = P_out_kW / (self.eta_mc_pct_ip(P_out_pct) / 100)
 
         # Interpolator eta(output load [kW]) [%]
-        self.eta_mc_kW_ip = interpolate.interp1d(
-            [e / 100 * self.P_out_rated for e in self.eta_mc_pct[0]],
-            self.eta_mc_pct[1],
-            kind='linear',
-            bounds_error=False,
-            fill_value=(self.eta_mc_pct[1][0],
-                        self.eta_mc_pct[1][-1]))
+        object.__setattr__(self, 'eta_mc_kW_ip', LinearInterpolator(P_out_kW, self.eta_mc_pct[1]))
 
         # Interpolator eta(input load [kW]) [%]
-        list_P_out_kW = [ol_perc / 100 * self.P_out_rated for ol_perc in self.eta_mc_pct[0]]
-        list_P_in_kW = [ol_perc / 100 * self.P_out_rated /
-                        (self.eta_mc_pct_ip(ol_perc) / 100) for ol_perc in self.eta_mc_pct[0]]
-        list_eta_in_kW = [ol / il * 100 if il != 0 else 0 for ol, il in
-                          zip(list_P_out_kW, list_P_in_kW)]
-
-        self.eta_mc_in_kW_ip = interpolate.interp1d(
-            list_P_in_kW,
-            list_eta_in_kW,
-            kind='linear',
-            bounds_error=False,
-            fill_value=(list_eta_in_kW[0],
-                        list_eta_in_kW[-1]))
+        with np.errstate(invalid='ignore'):
+            eta_in_kW = np.where(P_in_kW != 0, P_out_kW / P_in_kW * 100, 0)
+
+        object.__setattr__(self, 'eta_mc_in_kW_ip', LinearInterpolator(P_in_kW, eta_in_kW))
 
         # Load change energy interpolator Energy_state=f(Load [%])
         # ---------------------------------------------------------
-        self.E_loadchange_ip = interpolate.interp1d(self.E_loadchange[0],
-                                                    self.E_loadchange[1],
-                                                    kind='linear',
-                                                    bounds_error=False,
-                                                    fill_value=(self.E_loadchange[1][0],
-                                                                self.E_loadchange[1][-1]))
+        object.__setattr__(self, 'E_loadchange_ip',
+                           LinearInterpolator(self.E_loadchange[0], self.E_loadchange[1]))
 
         # Some characteristic loads for convenience:
-        # https://stackoverflow.com/questions/2474015/
-        # "Getting the index of the returned max or min item using max()/min() on a list"
-        self.P_out_etamax_pct = self.eta_pct[0][max(range(len(self.eta_pct[1])),
-                                                    key=self.eta_pct[1].__getitem__)]
-
-        self.P_out_min = self.P_out_min_pct / 100 * self.P_out_rated
-        self.P_out_etamax = self.P_out_etamax_pct / 100 * self.P_out_rated
-
-        self.P_in_min = self.P_out_min / (self.eta_pct_ip(self.P_out_min_pct) / 100)
-        self.P_in_max = self.P_out_rated / (self.eta_pct_ip(100) / 100)
-        self.P_in_etamax = self.P_out_etamax / (self.eta_pct_ip(self.P_out_etamax_pct) / 100)
-
-        self.P_in_mc_min = self.P_out_min / (self.eta_mc_pct_ip(self.P_out_min_pct) / 100)
-        self.P_in_mc_max = self.P_out_rated / (self.eta_mc_pct_ip(100) / 100)
-        self.P_in_mc_etamax = self.P_out_etamax / (self.eta_mc_pct_ip(self.P_out_etamax_pct) / 100)
-
-        self.split_P_sd1 = self.split_P_sd[0] / sum(self.split_P_sd)
-        self.split_P_sd2 = self.split_P_sd[1] / sum(self.split_P_sd)
+        # Info: np.argmax() returns first index of maximum efficiency
+        object.__setattr__(self, 'P_out_etamax_pct',
+                           self.eta_pct[0][int(np.argmax(self.eta_pct[1]))])
+
+        object.__setattr__(self, 'P_out_min', self.P_out_min_pct / 100 * self.P_out_rated)
+        object.__setattr__(self, 'P_out_etamax', self.P_out_etamax_pct / 100 * self.P_out_rated)
+
+        object.__setattr__(self, 'P_in_min',
+                           self.P_out_min / (self.eta_pct_ip(self.P_out_min_pct) / 100))
+        object.__setattr__(self, 'P_in_max', self.P_out_rated / (self.eta_pct_ip(100) / 100))
+        object.__setattr__(self, 'P_in_etamax',
+                           self.P_out_etamax / (self.eta_pct_ip(self.P_out_etamax_pct) / 100))
+
+        object.__setattr__(self, 'P_in_mc_min',
+                           self.P_out_min / (self.eta_mc_pct_ip(self.P_out_min_pct) / 100))
+        object.__setattr__(self, 'P_in_mc_max', self.P_out_rated / (self.eta_mc_pct_ip(100) / 100))
+        object.__setattr__(self, 'P_in_mc_etamax',
+                           self.P_out_etamax / (self.eta_mc_pct_ip(self.P_out_etamax_pct) / 100))
+
+        object.__setattr__(self, 'split_P_sd1', self.split_P_sd[0] / sum(self.split_P_sd))
+        object.__setattr__(self, 'split_P_sd2', self.split_P_sd[1] / sum(self.split_P_sd))
+
+        # Scalar parameters bundled for jit-compiled kernels
+        object.__setattr__(self, 'scalars', EConversionScalars(
+            P_out_min_pct=float(self.P_out_min_pct),
+            P_out_rated=float(self.P_out_rated),
+            P_out_min=float(self.P_out_min),
+            P_in_min=float(self.P_in_min),
+            P_in_mc_min=float(self.P_in_mc_min),
+            P_in_mc_max=float(self.P_in_mc_max),
+            p_change_st_pct=float(self.p_change_st_pct),
+            p_change_sd_pct=float(self.p_change_sd_pct),
+            p_change_pos=float(self.p_change_pos),
+            p_change_neg=float(self.p_change_neg),
+            E_preparation=float(self.E_preparation),
+            E_preparation_heat=float(self.E_preparation_heat),
+            E_preparation_loss=float(self.E_preparation_loss),
+            eta_preparation=float(self.eta_preparation),
+            split_P_sd1=float(self.split_P_sd1),
+            split_P_sd2=float(self.split_P_sd2)))
 
 
 @dataclass(frozen=False)
@@ -231,6 +269,25 @@ class EConversionState:
 
     errorcode: int = 0  # not implemented yet
 
+    @classmethod
+    def from_array(cls, values):
+        """
+        State from sequence or numpy array of values in order of fields (see STATE_FIELDS),
+        e.g. for states stored as arrays in jit-compiled simulation loops
+
+        :param values: sequence or 1d-array of values
+        """
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        *values, errorcode = values
+        # Info: errorcode is stored as float in float64 buffers
+        return cls(*values, int(errorcode))
+
+
+# Fixed order of state values in tuples and arrays, e.g. EnergyConversion.export_state_into()
+STATE_FIELDS = tuple(f.name for f in fields(EConversionState))
+_get_state_values = attrgetter(*STATE_FIELDS)
+
 
 class EnergyConversion:
     """
@@ -240,23 +297,61 @@ class EnergyConversion:
     def __init__(self, conv_par: EConversionParams,
                  conv_state: EConversionState,
                  ts,
+                 cache_size: int = 256,
                  # debug: bool = False (tbi)
                  ):
         """
         :param conv_par:    EConversionParams dataclass object
         :param conv_state:  EConversionState dataclass object
         :param ts:           timestep [min]
+        :param cache_size:   maximum number of cached step calculations and load conversions
+                             each, 0 disables caching
         # :param debug:       bool flag, not implemented yet
         """
 
-        # IDEA: Check if dataclass object conv_par can be frozen here
-
-        self.par = conv_par
-        self.ts = ts
-        cop = copy.deepcopy(conv_state)
+        # Info: Set without property setters, caches are created below
+        self._par = conv_par
+        self._ts = ts
+        # Info: EConversionState holds only floats/ints, shallow copy equals deep copy
+        cop = replace(conv_state)
         self.state_initial = cop  # Copy of initial state for reset()-method
+        # Frozen field values of initial state, reset() builds a fresh state from these
+        self._state_initial_fields = _get_state_values(cop)
         self.state = conv_state
 
+        # Cache of step calculations, key: state prior to action and action
+        # Info: Cache is cleared on assignment of self.par or self.ts, self.par itself is frozen
+        self.cache_size = cache_size
+        self._step_cache = {}
+
+        # Specialized functions with parameters bound as constants, cached for repeated loads
+        self._specialize_getters()
+
+    @property
+    def par(self) -> EConversionParams:
+        """
+        Parameters of component, assignment clears cache of step calculations and
+        re-creates load conversion functions
+        """
+        return self._par
+
+    @par.setter
+    def par(self, conv_par: EConversionParams):
+        self._par = conv_par
+        self.clear_cache()
+
+    @property
+    def ts(self):
+        """
+        Timestep [min], assignment clears cache of step calculations
+        """
+        return self._ts
+
+    @ts.setter
+    def ts(self, ts):
+        self._ts = ts
+        self._step_cache.clear()
+
     def step_action(self, action: float, hypothetical_step=False):
         """
         Define output target
@@ -289,6 +384,103 @@ class EnergyConversion:
          6.) Update state variables
 
         """
+        # 1.) - 5.) Calculation of new state, cached for repeated states and actions
+        # ---------------------------------------------------------
+        state = self.state
+        (heatup_1_pct, eta_1_pct, eta_mc_1_pct,
+         E_in, E_in_mc, E_loss, E_in_sd1, E_in_sd2, E_out,
+         P_in, P_in_mc, P_loss, P_in_sd1, P_in_sd2, P_out,
+         E_balance) = self._calc_step_cached(state.heatup_pct, state.P_out,
+                                             state.P_in, state.P_in_mc, action)
+
+        # 6.) Finally update state variables
+        # ---------------------------------------------------------
+        if not hypothetical_step:
+            state.E_in = E_in
+            state.E_in_mc = E_in_mc
+            state.E_in_sd1 = E_in_sd1
+            state.E_in_sd2 = E_in_sd2
+            state.E_out = E_out
+            state.E_loss = E_loss
+
+            state.P_in = P_in
+            state.P_in_mc = P_in_mc
+            state.P_in_sd1 = P_in_sd1
+            state.P_in_sd2 = P_in_sd2
+            state.P_out = P_out
+            state.P_loss = P_loss
+
+            state.heatup_pct = heatup_1_pct
+            state.eta_pct = eta_1_pct
+            state.eta_mc_pct = eta_mc_1_pct
+
+            state.E_balance = E_balance
+
+            # self.state.opex_Eur = opex_Eur
+            # self.state.errorcode = errorcode
+
+            pass
+
+        else:
+            # Info: Built as dict display (single allocation), keys unchanged
+            return {"E_in": E_in,
+                    "E_in_mc": E_in_mc,
+                    "E_in_sd1": E_in_sd1,
+                    "E_in_sd2": E_in_sd2,
+                    "E_out": E_out,
+                    "E_loss": E_loss,
+                    "E_balance": E_balance,
+
+                    "P_in": P_in,
+                    "P_in_mc": P_in_mc,
+                    "P_in_sd1": P_in_sd1,
+                    "P_in_sd2": P_in_sd2,
+                    "P_out": P_out,
+                    "P_loss": P_loss,
+
+                    "heatup_pct": heatup_1_pct,
+                    "state_eta_pct": eta_1_pct,
+                    "state_eta_mc_pct": eta_mc_1_pct,
+
+                    # "opex_Eur": opex_Eur,
+                    # "errorcode": errorcode,
+                    }
+
+    def _calc_step_cached(self, heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, action) -> tuple:
+        """
+        _calc_step() with cache of recent results, key: state prior to action and action.
+        Info: Plain dict without reference to self (no reference cycle), oldest entry is
+              dropped if self.cache_size is reached
+        """
+        # Info: Cast to float allows numpy scalars and 0d/1-element arrays as action (hashable key)
+        if not isinstance(action, float):
+            action = np.asarray(action, dtype=float).item()
+        if self.cache_size <= 0:
+            return self._calc_step(heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, action)
+
+        key = (heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, action)
+        cache = self._step_cache
+        res = cache.get(key)
+        if res is None:
+            res = self._calc_step(heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, action)
+            if len(cache) >= self.cache_size:
+                del cache[next(iter(cache))]
+            cache[key] = res
+        return res
+
+    def _calc_step(self, heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, action) -> tuple:
+        """
+        Calculation of new state for given state prior to action, see step_action().
+        Depends only on arguments, self.par and self.ts (cached in _calc_step_cached).
+
+        :return: heatup_pct, eta_pct, eta_mc_pct, values ordered as E_CHANGE_FIELDS, E_balance
+        """
+        if NUMBA_AVAILABLE:
+            # Single jit-compiled kernel for steps 1.) - 5.)
+            return conversion_step(float(heatup_0_pct), float(P_out_0), float(P_in_0),
+                                   float(P_in_mc_0), float(self._P_out_target_pct(action)),
+                                   *self.step_kernel_args())
+
         # error = 0  # Init error code
 
         # 1.) State calculations prior to action
@@ -300,120 +492,99 @@ class EnergyConversion:
         #               It is used only internally.
         #
 
-        if self.state.heatup_pct < 100:
-            P_out_0_pct = round(self.state.heatup_pct / 100 * self.par.P_out_min_pct, 6)
-        else:
-            P_out_0_pct = round(self.state.P_out / self.par.P_out_rated, 6) * 100
+        P_out_0_pct = self._P_out_0_pct(heatup_0_pct, P_out_0)
 
         # 2.) Application of control action
         # ---------------------------------------------------------
-        if not self.par.control_type_target:
-            raise Exception('No up-to-date implementation of this control type.')
-
-        else:  # --> Control type: target
-
-            # Limit input to valid action range
-            # Idea: Warning could be implement
-            if action > 1:
-                action = 1
-            elif action < 0:
-                action = 0
-
-            # Denormalize action [0,1] to load [%]
-            # Reason for implementation: Simple way to use different types of normalization for ML
-            P_out_target_pct = denorm(action, {'n': [self.par.norm_limits[0],
-                                                     self.par.norm_limits[1]],
-                                               'r': [0, 100]})
+        P_out_target_pct = self._P_out_target_pct(action)
 
         # Calculation of new heatup and load state [%]
         (P_out_1_pct,
-         heatup_1_pct, load_operation_time) = self._calc_P_change(P_out_target_pct=P_out_target_pct)
+         heatup_1_pct, load_operation_time) = self._calc_P_change(P_out_target_pct, heatup_0_pct,
+                                                                  P_out_0_pct)
 
         # 3.) Efficiency calculation
         # ---------------------------------------------------------
+        par = self.par
         if heatup_1_pct < 100:
-            eta_1_pct = self.par.eta_preparation
+            eta_1_pct = par.eta_preparation
             eta_mc_1_pct = 0
         else:
-            eta_1_pct = self.par.eta_pct_ip(P_out_1_pct).item(0)
-            eta_mc_1_pct = self.par.eta_mc_pct_ip(P_out_1_pct).item(0)
+            eta_1_pct = par.eta_pct_ip(P_out_1_pct)
+            eta_mc_1_pct = par.eta_mc_pct_ip(P_out_1_pct)
 
         # 4.) Energy Calculation
         # ---------------------------------------------------------
-        # Calculation of updated state
-        new_state_dict = self._calc_E_change(P_out_1_pct, P_out_0_pct, heatup_1_pct,
-                                             load_operation_time,
-                                             eta_1_pct, eta_mc_1_pct)
+        # Calculation of updated state, fixed order of values see E_CHANGE_FIELDS
+        (E_in, E_in_mc, E_loss, E_in_sd1, E_in_sd2, E_out,
+         P_in, P_in_mc, P_loss, P_in_sd1, P_in_sd2, P_out) = self._calc_E_change(
+            P_out_1_pct, P_out_0_pct, heatup_1_pct, load_operation_time, eta_1_pct, eta_mc_1_pct,
+            heatup_0_pct, P_in_0, P_in_mc_0, P_out_0)
 
         # 5.) Energy balance calculation
         # ---------------------------------------------------------
         # Info: Only calculation of balance, here no abort criteria
-        E_bulk1 = (heatup_1_pct - self.state.heatup_pct) / 100 * self.par.E_preparation_heat
-        E_bulk2 = (self.par.E_loadchange_ip(P_out_1_pct) - self.par.E_loadchange_ip(P_out_0_pct))
-        new_state_dict["E_balance"] = (new_state_dict["E_in_mc"] +
-                                       new_state_dict["E_in_sd1"] +
-                                       new_state_dict["E_in_sd2"] -
-                                       new_state_dict["E_out"] -
-                                       new_state_dict["E_loss"] -
-                                       E_bulk1 -
-                                       E_bulk2
-                                       )
-
-        # 6.) Finally update state variables
-        # ---------------------------------------------------------
-        if not hypothetical_step:
-            self.state.E_in = new_state_dict["E_in"]
-            self.state.E_in_mc = new_state_dict["E_in_mc"]
-            self.state.E_in_sd1 = new_state_dict["E_in_sd1"]
-            self.state.E_in_sd2 = new_state_dict["E_in_sd2"]
-            self.state.E_out = new_state_dict["E_out"]
-            self.state.E_loss = new_state_dict["E_loss"]
-
-            self.state.P_in = new_state_dict["P_in"]
-            self.state.P_in_mc = new_state_dict["P_in_mc"]
-            self.state.P_in_sd1 = new_state_dict["P_in_sd1"]
-            self.state.P_in_sd2 = new_state_dict["P_in_sd2"]
-            self.state.P_out = new_state_dict["P_out"]
-            self.state.P_loss = new_state_dict["P_loss"]
-
-            self.state.heatup_pct = heatup_1_pct
-            self.state.eta_pct = eta_1_pct
-            self.state.eta_mc_pct = eta_mc_1_pct
-
-            self.state.E_balance = new_state_dict["E_balance"]
-
-            # self.state.opex_Eur = new_state_dict["opex_Eur"]
-            # self.state.errorcode = new_state_dict["errorcode"]
+        E_bulk1 = (heatup_1_pct - heatup_0_pct) / 100 * par.E_preparation_heat
+        E_bulk2 = (par.E_loadchange_ip(P_out_1_pct) - par.E_loadchange_ip(P_out_0_pct))
+        E_balance = (E_in_mc +
+                     E_in_sd1 +
+                     E_in_sd2 -
+                     E_out -
+                     E_loss -
+                     E_bulk1 -
+                     E_bulk2
+                     )
+
+        return (heatup_1_pct, eta_1_pct, eta_mc_1_pct,
+                E_in, E_in_mc, E_loss, E_in_sd1, E_in_sd2, E_out,
+                P_in, P_in_mc, P_loss, P_in_sd1, P_in_sd2, P_out,
+                E_balance)
+
+    def _P_out_0_pct(self, heatup_0_pct, P_out_0) -> float:
+        """
+        Load [%] prior to action, artificial load below load operation (heatup_0_pct < 100)
+        Info: No rounding, comparisons of loads [%] use tolerance TOL_PCT
+        """
+        par = self.par
+        return (heatup_0_pct / 100 * par.P_out_min_pct if heatup_0_pct < 100
+                else P_out_0 / par.P_out_rated * 100)
 
-            pass
+    def _P_out_target_pct(self, action: float) -> float:
+        """
+        Application of control action: Target output load [%] for given action
+        """
+        par = self.par
+        if not par.control_type_target:
+            raise Exception('No up-to-date implementation of this control type.')
 
-        else:
-            hypothetical_state = dict()
-            hypothetical_state["E_in"] = new_state_dict["E_in"]
-            hypothetical_state["E_in_mc"] = new_state_dict["E_in_mc"]
-            hypothetical_state["E_in_sd1"] = new_state_dict["E_in_sd1"]
-            hypothetical_state["E_in_sd2"] = new_state_dict["E_in_sd2"]
-            hypothetical_state["E_out"] = new_state_dict["E_out"]
-            hypothetical_state["E_loss"] = new_state_dict["E_loss"]
-            hypothetical_state["E_balance"] = new_state_dict["E_balance"]
+        else:  # --> Control type: target
 
-            hypothetical_state["P_in"] = new_state_dict["P_in"]
-            hypothetical_state["P_in_mc"] = new_state_dict["P_in_mc"]
-            hypothetical_state["P_in_sd1"] = new_state_dict["P_in_sd1"]
-            hypothetical_state["P_in_sd2"] = new_state_dict["P_in_sd2"]
-            hypothetical_state["P_out"] = new_state_dict["P_out"]
-            hypothetical_state["P_loss"] = new_state_dict["P_loss"]
+            # Limit input to valid action range
+            # Idea: Warning could be implement
+            if action > 1:
+                action = 1
+            elif action < 0:
+                action = 0
 
-            hypothetical_state["heatup_pct"] = heatup_1_pct
-            hypothetical_state["state_eta_pct"] = eta_1_pct
-            hypothetical_state["state_eta_mc_pct"] = eta_mc_1_pct
+            # Denormalize action [0,1] to load [%]
+            # Reason for implementation: Simple way to use different types of normalization for ML
+            return denorm(action, {'n': [par.norm_limits[0],
+                                         par.norm_limits[1]],
+                                   'r': [0, 100]})
 
-            # hypothetical_state["opex_Eur"] = new_state_dict["opex_Eur"]
-            # hypothetical_state["errorcode"] = new_state_dict["errorcode"]
+    def _P_out_target_pct_array(self, actions: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of _P_out_target_pct() for an array of actions
+        """
+        par = self.par
+        if not par.control_type_target:
+            raise Exception('No up-to-date implementation of this control type.')
 
-            return hypothetical_state
+        return denorm(np.clip(actions, 0, 1), {'n': [par.norm_limits[0],
+                                                     par.norm_limits[1]],
+                                               'r': [0, 100]})
 
-    def _calc_P_change(self, P_out_target_pct):
+    def _calc_P_change(self, P_out_target_pct, heatup_0_pct, P_out_0_pct):
         """
         Calculate new load P
 
@@ -425,98 +596,18 @@ class EnergyConversion:
         and 3 cases for load decrease:        [O->O, O->S, S->S].
 
         :param P_out_target_pct: Target load [%]
+        :param heatup_0_pct: heatup state [%] prior to action
+        :param P_out_0_pct: load [%] prior to action, see _P_out_0_pct()
 
         :return: P_out_pct  new P_out [%]
         :return: heatup_pct new heatup state [%]
         :return: load_operation_time time in operation [min]
         """
-        # Initialization
-        # ---------------------------------------
-        # Additional state calculations prior to action
-        # Info: Below minimum load corner point, real component output load is zero.
-        #               However for calculation of changes in heatup or cooldown states it is
-        #               used as an artificial variable (for simplicity) and is therefore calculated
-        #               below based on the below-load-operation state variable heatup_pct.
-        #               It is used only internally.
-
-        if self.state.heatup_pct < 100:
-            P_out_pct = round(self.state.heatup_pct / 100 * self.par.P_out_min_pct, 6)
-        else:
-            P_out_pct = round(self.state.P_out / self.par.P_out_rated, 6) * 100
-
-        load_operation_time = 0  # min
-        heatup_pct = self.state.heatup_pct
-
-        # Positive load changes & load holding
-        # ---------------------------------------
-        if P_out_pct <= P_out_target_pct:
-
-            # [S->S]
-            if P_out_target_pct < self.par.P_out_min_pct:
-                P_out_pct = min(P_out_target_pct,
-                                P_out_pct + self.par.p_change_st_pct * self.ts)
-                heatup_pct = P_out_pct / self.par.P_out_min_pct * 100
-
-            # [S->O (potentially)]
-            elif (P_out_target_pct >= self.par.P_out_min_pct) and \
-                    (P_out_pct < self.par.P_out_min_pct):
-
-                prep_delta_perc = (self.par.P_out_min_pct - P_out_pct)  # %pts to min. load
-                prep_time_min = prep_delta_perc / self.par.p_change_st_pct  # time to min. load
-                if prep_time_min <= self.ts:  # --> "O" reached
-                    P_out_pct = min(P_out_target_pct,
-                                    self.par.P_out_min_pct + self.par.p_change_pos * (
-                                            self.ts - prep_time_min))
-                    load_operation_time = self.ts - prep_time_min
-                    heatup_pct = 100
-                else:  # --> "O" not reached
-                    P_out_pct = P_out_pct + self.par.p_change_st_pct * self.ts
-                    heatup_pct = P_out_pct / self.par.P_out_min_pct * 100
-
-            # [O->O]
-            elif (P_out_target_pct >= self.par.P_out_min_pct) and \
-                    (P_out_pct >= self.par.P_out_min_pct):
-
-                P_out_pct = min(P_out_target_pct,
-                                P_out_pct + self.par.p_change_pos * self.ts)
-                load_operation_time = self.ts
-
-        # Negative load changes
-        # ---------------------------------------
-        elif P_out_pct > P_out_target_pct:
-            # [O->O]
-            if P_out_target_pct >= self.par.P_out_min_pct:
-                P_out_pct = max(P_out_target_pct,
-                                P_out_pct - self.par.p_change_neg * self.ts)
-                load_operation_time = self.ts
-
-            # [O->S(potentially)]
-            elif (P_out_target_pct < self.par.P_out_min_pct) and \
-                    (P_out_pct >= self.par.P_out_min_pct):
-
-                load_delta_perc = (P_out_pct - self.par.P_out_min_pct)  # %pts to min load
-                unload_time_min = load_delta_perc / self.par.p_change_neg  # time to min load
-                if unload_time_min < self.ts:  # --> shutdown mode reached
-                    P_out_pct = max(P_out_target_pct,
-                                    self.par.P_out_min_pct - self.par.p_change_sd_pct * (
-                                            self.ts - unload_time_min))
-                    heatup_pct = P_out_pct / self.par.P_out_min_pct * 100
-                    load_operation_time = unload_time_min
-                else:  # --> shutdown mode not reached
-                    P_out_pct = P_out_pct - self.par.p_change_neg * self.ts
-                    load_operation_time = self.ts
-            # [S->S]
-            elif (P_out_target_pct < self.par.P_out_min_pct) and \
-                    (P_out_pct < self.par.P_out_min_pct):
-
-                P_out_pct = max(P_out_target_pct,
-                                P_out_pct - self.par.p_change_sd_pct * self.ts)
-                heatup_pct = P_out_pct / self.par.P_out_min_pct * 100
-
-        return P_out_pct, heatup_pct, load_operation_time
+        return _calc_P_change_kernel(float(P_out_0_pct), float(heatup_0_pct),
+                                     float(P_out_target_pct), float(self.ts), self.par.scalars)
 
     def _calc_E_change(self, P_out_pct, P_out_0_pct, heatup_1_pct, load_operation_time,
-                       eta_1_pct, eta_mc_1_pct) -> dict:
+                       eta_1_pct, eta_mc_1_pct, heatup_0_pct, P_in_0, P_in_mc_0, P_out_0) -> tuple:
         """
         Energy calculation from prior state P_out_0_pct to new state P_out_pct
         Case distinction required:
@@ -525,197 +616,136 @@ class EnergyConversion:
          - load operation -> noLoad operation [L->NL]
          - noLoad operation -> load operation [NL->L]
 
-        :return: new_state: dict
-        """
-        # Init return dict
-        new_state = dict.fromkeys(['E_in', 'E_in_mc', 'E_loss', "E_in_sd1", "E_in_sd2", "E_out",
-                                   'P_in', 'P_in_mc', 'P_loss', "P_in_sd1", "P_in_sd2", "P_out"])
-
-        # [NL->NL], P_out_pct >= P_out_0_pct
-        # (if required) Energy amount for 'holding prior idle state (loss compensation)'
-        if (heatup_1_pct < 100) and (P_out_pct >= P_out_0_pct):
-            if P_out_pct == P_out_0_pct + self.par.p_change_st_pct * self.ts:
-                # -> Maximum start speed
-                # Loss during pure startup is expected to be included in given E_preparation
-                # and therefore no additional compensation is required #IDEA
-                E_compens = 0
-                E_compens_loss = 0
-
-            elif P_out_pct - self.par.p_change_sd_pct * self.ts < 0:
-                # In low heatup state, compesation is neglected, which is
-                # sufficient for rule based control (as this is no reasonable target state),
-                # however needs to be refined for advanced control #IDEA
-                E_compens = 0
-                E_compens_loss = 0
-
-            elif P_out_pct == P_out_0_pct:
-                # calculate compensation energy and loss of it (just for holding the state)
-                E_compens = (self.par.p_change_sd_pct * self.ts / self.par.P_out_min_pct) \
-                            * self.par.E_preparation
-                E_compens_loss = E_compens
-
-            else:
-                # For all other startup targets, compesation is neglected, which is
-                # sufficient for rule based control (as this is no reasonable target state),
-                # however needs to be refined for advanced control #IDEA
-                E_compens = 0
-                E_compens_loss = 0
-
-            # Energy amount for 'changing heatup state'
-            E_startup = (heatup_1_pct - self.state.heatup_pct) / 100 * self.par.E_preparation
-            E_startup_loss = (
-                    (heatup_1_pct - self.state.heatup_pct) / 100 * self.par.E_preparation_loss)
-
-            E_startup_combined = E_compens + E_startup
-
-            # State variables
-            new_state["E_in_mc"] = 0
-            new_state["E_loss"] = E_compens_loss + E_startup_loss
-            new_state["P_in_mc"] = 0
-            new_state["P_loss"] = new_state["E_loss"] / (self.ts / 60)
-
-            new_state["E_in_sd1"] = self.par.split_P_sd1 * E_startup_combined
-            new_state["E_in_sd2"] = self.par.split_P_sd2 * E_startup_combined
-
-            new_state["P_in_sd1"] = new_state["E_in_sd1"] / (self.ts / 60)
-            new_state["P_in_sd2"] = new_state["E_in_sd2"] / (self.ts / 60)
-
-            # No output energy & load for heatup_pct < 100
-            new_state["E_out"] = 0
-            new_state["P_out"] = 0
-
-        # [xx->NL] P_out_pct < P_out_0_pct
-        elif (heatup_1_pct < 100) and (P_out_pct < P_out_0_pct):
-
-            # If required calculate operating portion (.._op) of input energy
-            if self.state.heatup_pct == 100:
-                E_in_op = (self.state.P_in + self.par.P_in_min) / 2 * (load_operation_time / 60)
-
-                # Main conversion
-                E_in_mc_op = ((self.state.P_in_mc + self.par.P_in_mc_min) /
-                              2 * (load_operation_time / 60))
-
-                # Load Change
-                E_loadchange_op = (self.par.E_loadchange_ip(P_out_pct) -
-                                   self.par.E_loadchange_ip(P_out_0_pct))
-
-                # Secondary Energy
-                E_in_sd_op = E_in_op - E_in_mc_op + E_loadchange_op
-                E_in_sd1_op = self.par.split_P_sd1 * E_in_sd_op
-                E_in_sd2_op = self.par.split_P_sd2 * E_in_sd_op
-
-                E_out = (self.state.P_out + self.par.P_out_min) / 2 * (
-                        load_operation_time / 60)
-                E_loss_op = E_in_op - E_out
-            else:
-                E_in_mc_op = 0
-                E_in_sd1_op = 0
-                E_in_sd2_op = 0
-                E_loss_op = 0
-                E_out = 0
-
-            # Coast down portion
-            coastdown_time = self.ts - load_operation_time
-            P_out_cooldownst_pct = min(P_out_0_pct, self.par.P_out_min_pct)  # PStart of coast down
-            # (Hypothetically) max. cooldown during give time:
-            diff_cooldown_max_pct = min(self.par.p_change_sd_pct * coastdown_time,
-                                        P_out_cooldownst_pct)
-
-            # If required calculate energy amount for coast down ( for superposed energy input)
-            if P_out_pct > P_out_cooldownst_pct - diff_cooldown_max_pct:
-                diff_load_perc = P_out_pct - (P_out_cooldownst_pct - diff_cooldown_max_pct)
-                E_diff = diff_load_perc / self.par.P_out_min_pct * self.par.E_preparation
-                E_in_sd1_cd = self.par.split_P_sd1 * E_diff
-                E_in_sd2_cd = self.par.split_P_sd2 * E_diff
-
-            else:
-                diff_load_perc = 0
-                E_in_sd1_cd = 0
-                E_in_sd2_cd = 0
-
-            E_loss_cd = (diff_cooldown_max_pct /
-                         self.par.P_out_min_pct) * self.par.E_preparation_heat + \
-                        (diff_load_perc / self.par.P_out_min_pct) * self.par.E_preparation_loss
-
-            # state variables
-            new_state["E_in_mc"] = E_in_mc_op
-            new_state["E_loss"] = E_loss_op + E_loss_cd
-            new_state["P_in_mc"] = 0
-            new_state["P_loss"] = E_loss_cd / (coastdown_time / 60)
-
-            new_state["E_in_sd1"] = E_in_sd1_op + E_in_sd1_cd
-            new_state["E_in_sd2"] = E_in_sd2_op + E_in_sd2_cd
-
-            new_state["E_out"] = E_out
-            new_state["P_out"] = 0
-
-            # Power at end of time step is mean energy of coast down, not inluding prior load
-            # operation
-            new_state["P_in_sd1"] = E_in_sd1_cd / (coastdown_time / 60)
-            new_state["P_in_sd2"] = E_in_sd2_cd / (coastdown_time / 60)
-
-        else:  # [xx->L] Load Operation
-            # Energy calculations
-            P_out = self.par.P_out_rated * (P_out_pct / 100)
-
-            E_out = (max(self.state.P_out, self.par.P_out_min) + P_out) / 2 * (
-                    load_operation_time / 60)
-
-            P_in = P_out / (eta_1_pct / 100)
-            P_in_mc = P_out / (eta_mc_1_pct / 100)
-
-            # If required calculate starting portion of input energy
-            if self.state.heatup_pct < 100:
-                # Startup phase
-                E_in_hp = ((heatup_1_pct - self.state.heatup_pct) / 100 * self.par.E_preparation)
-                E_loss_hp = E_in_hp * ((100 - self.par.eta_preparation) / 100)
-                E_in_sd1_hp = self.par.split_P_sd1 * E_in_hp
-                E_in_sd2_hp = self.par.split_P_sd2 * E_in_hp
-
-            else:
-                E_loss_hp = 0
-                E_in_sd1_hp = 0
-                E_in_sd2_hp = 0
-
-            # Operating Phase
-            E_in_op = (max(self.state.P_in, self.par.P_in_min) + P_in) / 2 * (
-                    load_operation_time / 60)
-            E_in_mc_op = ((max(self.state.P_in_mc, self.par.P_in_mc_min) + P_in_mc) /
-                          2 * (load_operation_time / 60))
-            # Load Change
-            E_loadchange_op = (self.par.E_loadchange_ip(P_out_pct) -
-                               self.par.E_loadchange_ip(P_out_0_pct))
+        heatup_0_pct, P_in_0, P_in_mc_0, P_out_0: state prior to action
 
-            E_in_sd_op = E_in_op - E_in_mc_op + E_loadchange_op
-            E_in_sd1_op = self.par.split_P_sd1 * E_in_sd_op
-            E_in_sd2_op = self.par.split_P_sd2 * E_in_sd_op
-            E_loss_op = E_in_op - E_out
+        :return: new_state: tuple of values, ordered as E_CHANGE_FIELDS
+        """
+        # Info: Casting to float avoids multiple compilations of kernel for int arguments
+        par = self.par
+        return _calc_E_change_kernel(P_out_pct, P_out_0_pct, heatup_1_pct, load_operation_time,
+                                     float(eta_1_pct), float(eta_mc_1_pct),
+                                     float(heatup_0_pct),
+                                     float(P_in_0),
+                                     float(P_in_mc_0),
+                                     float(P_out_0),
+                                     float(self.ts), par.scalars,
+                                     par.E_loadchange_ip.x,
+                                     par.E_loadchange_ip.y)
+
+    def step_action_sequence(self, actions) -> dict:
+        """
+        Performs step_action() for each action of given sequence, state is updated to state after
+        last action.
+        With numba, all time steps are calculated in a single jit-compiled loop
+        (conversion_trajectory()). Without, efficiencies of all time steps are interpolated at
+        once, as load trajectory is independent of energy calculations.
+
+        :param actions: sequence of actions, see step_action()
+        :return: dict of numpy arrays with state variables (keys as EConversionState) after each
+            action
+        """
+        actions = np.asarray(actions, dtype=float).ravel()
+        n = len(actions)
+        P_out_target_pct = self._P_out_target_pct_array(actions)
+
+        if NUMBA_AVAILABLE:
+            out = conversion_trajectory(P_out_target_pct, float(self.state.heatup_pct),
+                                        float(self.state.P_out), float(self.state.P_in),
+                                        float(self.state.P_in_mc), *self.step_kernel_args())
+            res = {name: out[:, i].copy() for i, name in enumerate(STEP_FIELDS)}
+        else:
+            res = self._step_sequence_vectorized(P_out_target_pct)
 
-            # New state variables
-            new_state["E_in_mc"] = E_in_mc_op
-            new_state["E_in_sd1"] = E_in_sd1_op + E_in_sd1_hp
-            new_state["E_in_sd2"] = E_in_sd2_op + E_in_sd2_hp
-            new_state["E_out"] = E_out
-            new_state["E_loss"] = E_loss_op + E_loss_hp
+        # 6.) Update state variables to last time step
+        # ---------------------------------------------------------
+        if n > 0:
+            for name, values in res.items():
+                setattr(self.state, name, values[-1].item())
 
-            new_state["P_in_mc"] = P_in_mc
-            new_state["P_in_sd1"] = (P_in - P_in_mc) * self.par.split_P_sd1
-            new_state["P_in_sd2"] = (P_in - P_in_mc) * self.par.split_P_sd2
-            new_state["P_loss"] = P_in - P_out
-            new_state["P_out"] = P_out
+        return res
 
-        # Summation of total input energy and load
-        new_state["E_in"] = new_state["E_in_mc"] + new_state["E_in_sd1"] + new_state["E_in_sd2"]
-        new_state["P_in"] = new_state["P_in_mc"] + new_state["P_in_sd1"] + new_state["P_in_sd2"]
+    def _step_sequence_vectorized(self, P_out_target_pct) -> dict:
+        """
+        Calculation of step_action_sequence() without numba, see there.
+        State is not updated.
 
-        return new_state
+        :param P_out_target_pct: array of target loads [%]
+        :return: dict of numpy arrays with state variables after each action
+        """
+        n = len(P_out_target_pct)
+        par = self.par
+        state = self.state
+
+        # 1.) & 2.) Load and heatup trajectory [%]
+        # ---------------------------------------------------------
+        P_out_0_pct = np.empty(n)
+        P_out_pct = np.empty(n)
+        heatup_pct = np.empty(n)
+        load_operation_time = np.empty(n)
+
+        heatup_0 = state.heatup_pct
+        P_out_0 = state.P_out
+        ts = float(self.ts)
+        for i in range(n):
+            P_out_0_pct[i] = self._P_out_0_pct(heatup_0, P_out_0)
+
+            (P_out_pct[i], heatup_pct[i],
+             load_operation_time[i]) = _calc_P_change_kernel(P_out_0_pct[i], float(heatup_0),
+                                                             P_out_target_pct[i],
+                                                             ts, par.scalars)
+            # Output load (state) is zero below load operation, see _calc_E_change_kernel()
+            heatup_0 = heatup_pct[i]
+            P_out_0 = par.P_out_rated * (P_out_pct[i] / 100) if heatup_0 >= 100 else 0
+
+        # 3.) Efficiency calculation, single interpolation for all time steps
+        # ---------------------------------------------------------
+        load = heatup_pct >= 100
+        eta_pct = np.where(load, par.eta_pct_ip(P_out_pct), par.eta_preparation)
+        eta_mc_pct = np.where(load, par.eta_mc_pct_ip(P_out_pct), 0.)
+
+        # 4.) Energy Calculation
+        # ---------------------------------------------------------
+        res = {name: np.empty(n) for name in E_CHANGE_FIELDS}
+        heatup_0 = state.heatup_pct
+        P_in_0, P_in_mc_0, P_out_0 = state.P_in, state.P_in_mc, state.P_out
+        calc_E_change = self._calc_E_change
+        for i in range(n):
+            new_state = calc_E_change(P_out_pct[i], P_out_0_pct[i], heatup_pct[i],
+                                      load_operation_time[i], eta_pct[i], eta_mc_pct[i],
+                                      heatup_0, P_in_0, P_in_mc_0, P_out_0)
+            for name, val in zip(E_CHANGE_FIELDS, new_state):
+                res[name][i] = val
+            heatup_0 = heatup_pct[i]
+            P_in_0, P_in_mc_0, P_out_0 = res['P_in'][i], res['P_in_mc'][i], res['P_out'][i]
+
+        # 5.) Energy balance calculation
+        # ---------------------------------------------------------
+        E_bulk1 = np.diff(heatup_pct, prepend=state.heatup_pct) / 100 * par.E_preparation_heat
+        E_bulk2 = (par.E_loadchange_ip(P_out_pct) - par.E_loadchange_ip(P_out_0_pct))
+        res["E_balance"] = (res["E_in_mc"] +
+                            res["E_in_sd1"] +
+                            res["E_in_sd2"] -
+                            res["E_out"] -
+                            res["E_loss"] -
+                            E_bulk1 -
+                            E_bulk2
+                            )
+        res["heatup_pct"] = heatup_pct
+        res["eta_pct"] = eta_pct
+        res["eta_mc_pct"] = eta_mc_pct
+
+        return res
 
     def step_action_stationary(self, action: float) -> None:
         """
-        Performs step_action() until target "action" is reached.
-        Condition for stationarity:
-        E_in @ t-1 == E_in @ t
-        P_out @ t-1 == P_out @ t
+        Performs step_action() for stationary state at target "action" (target load reached and
+        held), e.g. for characteristic curves.
+
+        Instead of repeated step_action() calls until stationarity, the stationary state prior
+        to the action is set directly:
+         - load operation: output load at target, input loads from efficiencies
+         - below minimum load: heatup state held at target, no output load
+        followed by a single step_action() holding this state.
 
         Parameters
         ----------
@@ -725,26 +755,53 @@ class EnergyConversion:
         -------
 
         """
-        ct_iteration = 0
-        P_out_pct_target = action * 100
-        P_out_pct = self.state.P_out / self.par.P_out_rated * 100
-
-        cond = False
-        while not ((P_out_pct_target == P_out_pct) and cond) and (ct_iteration <= 100):
-            E_in_0 = self.state.E_in
-            self.step_action(action)
-            P_out_pct = self.state.P_out / self.par.P_out_rated * 100
-            E_in_1 = self.state.E_in
-            if E_in_0 == E_in_1:
-                cond = True
-            ct_iteration += 1
+        P_out_target_pct = self._P_out_target_pct(action)
+        par = self.par
+        state = self.state
+
+        if P_out_target_pct >= par.P_out_min_pct - TOL_PCT:
+            state.heatup_pct = 100
+            state.P_out = par.P_out_rated * (P_out_target_pct / 100)
+            state.P_in = state.P_out / (par.eta_pct_ip(P_out_target_pct) / 100)
+            state.P_in_mc = state.P_out / (par.eta_mc_pct_ip(P_out_target_pct) / 100)
+        else:
+            state.heatup_pct = P_out_target_pct / par.P_out_min_pct * 100
+            state.P_out = 0
+            state.P_in = 0
+            state.P_in_mc = 0
 
         # Final Step
         self.step_action(action)
 
-        if ct_iteration == 100:
-            raise Exception("Stationary step did not converge.")
-        pass
+    def step_action_stationary_batch(self, actions) -> dict:
+        """
+        Vectorized version of step_action_stationary() for an array of actions, e.g. for
+        characteristic curves. Stationary states prior to the actions are set up for all actions
+        at once, followed by a single step each. State is not updated.
+
+        :param actions: sequence of actions, see step_action()
+        :return: dict of numpy arrays with state variables (keys as EConversionState) after each
+            action
+        """
+        actions = np.asarray(actions, dtype=float).ravel()
+        P_out_target_pct = self._P_out_target_pct_array(actions)
+        par = self.par
+
+        # Stationary states prior to actions, see step_action_stationary()
+        load = P_out_target_pct >= par.P_out_min_pct - TOL_PCT
+        heatup_0_pct = np.where(load, 100., P_out_target_pct / par.P_out_min_pct * 100)
+        P_out_0 = np.where(load, par.P_out_rated * (P_out_target_pct / 100), 0.)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            P_in_0 = np.where(load, P_out_0 / (par.eta_pct_ip(P_out_target_pct) / 100), 0.)
+            P_in_mc_0 = np.where(load, P_out_0 / (par.eta_mc_pct_ip(P_out_target_pct) / 100), 0.)
+
+        # Final Step
+        out = np.empty((len(actions), len(STEP_FIELDS)))
+        calc_step = self._calc_step
+        for i in range(len(actions)):
+            out[i] = calc_step(heatup_0_pct[i], P_out_0[i], P_in_0[i], P_in_mc_0[i], actions[i])
+
+        return {name: out[:, i].copy() for i, name in enumerate(STEP_FIELDS)}
 
     def action_for_P_in_mc_target(self, input_load: float) -> float:
         """
@@ -752,7 +809,7 @@ class EnergyConversion:
         given main conversion(!) input load requirement [kW]
 
         Only usable for load operation!
-        Returns error if input_load < minimum input load.
+        Raises ValueError if input_load is outside of operation range.
 
         Solves:
 
@@ -766,18 +823,18 @@ class EnergyConversion:
         # def func(x):
         #     return input_load / self.par.p_out * self.eta(x * 100) / 100 - x
 
-        # Check if input_load is above required minimum
-        if input_load < self.par.P_in_mc_min:
-            raise Exception("Input load too low for action")
-        elif input_load > self.par.P_in_mc_max:
-            raise Exception("Input load too high for action")
-        else:
-            # root = fsolve(func, [0], full_output=True)
-            # val = root[0][0]
-            # conv = root[2]
-            P_out = input_load * self.par.eta_mc_in_kW_ip(input_load) / 100
+        # root = fsolve(func, [0], full_output=True)
+        # val = root[0][0]
+        # conv = root[2]
+        action, status = self._action_for_P_in_mc_target_status(input_load)
 
-            return P_out / self.par.P_out_rated
+        # Check if input_load is within operation range
+        if status < 0:
+            raise ValueError("Input load too low for action")
+        elif status > 0:
+            raise ValueError("Input load too high for action")
+        else:
+            return action
 
     def action_for_E_in_mc_target(self, input_load: float) -> float:
         """
@@ -809,30 +866,740 @@ class EnergyConversion:
         Simple function that applies output load in kW and get equivalent main conversion
          input load [kW].
         Only usable for load operation
-        Returns error if below minimum output load
+        Raises ValueError if output load is outside of operation range
 
         :param output_load:  Output load [kW]
 
         """
+        input_mc_load, status = self.P_in_mc_from_P_out_status(output_load)
 
-        # Check if input_load is above required minimum
-        if output_load < self.par.P_out_min:
-            raise Exception("Output load too low for action")
-        elif output_load > self.par.P_out_rated:
-            raise Exception("Output load too high for action")
+        if status < 0:
+            raise ValueError("Output load too low for action")
+        elif status > 0:
+            raise ValueError("Output load too high for action")
         else:
-            output_load_perc = output_load / self.par.P_out_rated * 100
-            input_mc_load = output_load / (self.par.eta_mc_pct_ip(output_load_perc) / 100)
             return input_mc_load
 
+    def P_in_mc_from_P_out_status(self, output_load: float) -> Tuple[float, int]:
+        """
+        As P_in_mc_from_P_out(), but without raising an error for output loads outside of
+        operation range (e.g. for optimizer loops).
+
+        :param output_load:  Output load [kW]
+        :return: main conversion input load [kW] (nan, if status != 0),
+                 status: 0: valid, -1: below minimum output load, 1: above rated output load
+        """
+        return self._P_in_mc_from_P_out_status(output_load)
+
+    def P_in_mc_from_P_out_batch(self, output_loads, strict: bool = True) -> np.ndarray:
+        """
+        Vectorized version of P_in_mc_from_P_out() for an array of output loads [kW].
+        Evaluation is parallelized, if numba is available.
+
+        :param output_loads:  Array of output loads [kW]
+        :param strict: If true, raise ValueError if any output load is outside of operation
+            range, else return nan for these output loads
+        :return: Array of main conversion input loads [kW]
+        """
+        output_loads = np.ascontiguousarray(output_loads, dtype=float).ravel()
+
+        par = self.par
+        below = output_loads < par.P_out_min
+        above = output_loads > par.P_out_rated
+        # Check if all output loads are within operation range
+        if strict:
+            if np.any(below):
+                raise ValueError("Output load too low for action")
+            elif np.any(above):
+                raise ValueError("Output load too high for action")
+
+        eta_ip = par.eta_mc_kW_ip
+        if NUMBA_AVAILABLE:
+            input_mc_loads = np.empty_like(output_loads)
+            _P_in_mc_from_P_out_batch(output_loads, par.scalars, eta_ip.x, eta_ip.y,
+                                      input_mc_loads)
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if eta_ip.dx_inv:
+                    # Without numba: vectorized lookup with direct index computation
+                    input_mc_loads = output_loads * 100 / interp_uniform(
+                        output_loads, eta_ip.x, eta_ip.dx_inv, eta_ip.y)
+                else:
+                    input_mc_loads = output_loads * 100 / eta_ip(output_loads)
+            if not strict:
+                input_mc_loads[below | above] = np.nan
+        return input_mc_loads
+
+    def action_for_P_in_mc_target_batch(self, input_loads, strict: bool = True) -> np.ndarray:
+        """
+        Vectorized version of action_for_P_in_mc_target() for an array of main conversion input
+        loads [kW]. Evaluation is parallelized, if numba is available.
+
+        :param input_loads:  Array of main conversion input loads [kW]
+        :param strict: If true, raise ValueError if any input load is outside of operation
+            range, else return nan for these input loads
+        :return: Array of actions
+        """
+        input_loads = np.ascontiguousarray(input_loads, dtype=float).ravel()
+
+        par = self.par
+        below = input_loads < par.P_in_mc_min
+        above = input_loads > par.P_in_mc_max
+        # Check if all input loads are within operation range
+        if strict:
+            if np.any(below):
+                raise ValueError("Input load too low for action")
+            elif np.any(above):
+                raise ValueError("Input load too high for action")
+
+        eta_ip = par.eta_mc_in_kW_ip
+        if NUMBA_AVAILABLE:
+            actions = np.empty_like(input_loads)
+            _action_for_P_in_mc_target_batch(input_loads, par.scalars, eta_ip.x, eta_ip.y,
+                                             actions)
+        else:
+            actions = input_loads * eta_ip(input_loads) / 100 / par.P_out_rated
+            if not strict:
+                actions[below | above] = np.nan
+        return actions
+
+    def export_state_into(self, buf: np.ndarray, row: int):
+        """
+        Write current state into row of preallocated array (columns ordered as STATE_FIELDS),
+        e.g. for recording of trajectories without creation of a dict per time step.
+        Values are cast to dtype of buf, e.g. np.float32 for traces with half memory
+        (calculations remain float64).
+
+        :param buf: array of shape (number of rows, len(STATE_FIELDS))
+        :param row: row index
+        """
+        buf[row] = _get_state_values(self.state)
+
+    def step_action_into(self, action: float, buf: np.ndarray, row: int):
+        """
+        Performs step_action() and writes the updated state into row of preallocated array
+        (columns ordered as STATE_FIELDS), see export_state_into().
+        State of a row can be restored with EConversionState.from_array(buf[row]).
+
+        :param action: see step_action()
+        :param buf: array of shape (number of rows, len(STATE_FIELDS))
+        :param row: row index
+        """
+        self.step_action(action)
+        buf[row] = _get_state_values(self.state)
+
+    def step_kernel_args(self) -> tuple:
+        """
+        Parameter arguments of conversion_step() for this component and timestep,
+        for use of conversion_step() in jit-compiled simulation loops
+
+        :return: ts, scalar parameters, support points of eta, eta_mc and E_loadchange
+        """
+        par = self.par
+        return (float(self.ts), par.scalars,
+                par.eta_pct_ip.x, par.eta_pct_ip.y,
+                par.eta_mc_pct_ip.x, par.eta_mc_pct_ip.y,
+                par.E_loadchange_ip.x, par.E_loadchange_ip.y)
+
+    def __getstate__(self):
+        """
+        Pickle support (e.g. for multiprocessing): caches and specialized functions are not
+        picklable and are re-created in __setstate__()
+        """
+        state = self.__dict__.copy()
+        for name in ('_step_cache', '_P_in_mc_from_P_out_status',
+                     '_action_for_P_in_mc_target_status'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._step_cache = {}
+        self._specialize_getters()
+
+    def clear_cache(self):
+        """
+        Clear cache of step calculations and load conversions, done on assignment of
+        self.par or self.ts, required only after in-place changes of self.par
+        """
+        self._step_cache.clear()
+        self._specialize_getters()
+
+    def _specialize_getters(self):
+        """
+        (Re-)Creation of cached load conversion functions for current self.par
+        Info: Cache keys are exact loads, no rounding
+        """
+        self._P_in_mc_from_P_out_status = lru_cache(maxsize=self.cache_size)(
+            _specialize_P_in_mc_from_P_out_status(self.par))
+        self._action_for_P_in_mc_target_status = lru_cache(maxsize=self.cache_size)(
+            _specialize_action_for_P_in_mc_target_status(self.par))
+
     def reset(self):
         """
         Reset to initial state
         (e.g. for ML/RL-Algorithms)
 
+        Info: New state is created from field values cached in __init__(),
+              later changes of self.state_initial are not considered.
+
         :return:
         """
-        self.state = copy.deepcopy(self.state_initial)
+        self.state = EConversionState(*self._state_initial_fields)
+
+
+@njit(cache=True, nogil=True)
+def conversion_step(heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, P_out_target_pct, ts, par,
+                    eta_x, eta_y, eta_mc_x, eta_mc_y, E_loadchange_x, E_loadchange_y):
+    """
+    Calculation of new state for given state prior to action and target load, see
+    EnergyConversion.step_action(). Pure function of scalars and arrays, can be called from
+    jit-compiled (outer) simulation loops, e.g.:
+
+        args = conv.step_kernel_args()
+        res = conversion_step(heatup_pct, P_out, P_in, P_in_mc, P_out_target_pct, *args)
+
+    :param heatup_0_pct, P_out_0, P_in_0, P_in_mc_0: state prior to action
+    :param P_out_target_pct: Target load [%], see EnergyConversion._P_out_target_pct()
+    :param ts: timestep [min]
+    :param par: EConversionScalars
+    :param eta_x, eta_y: support points of efficiency eta(output load [%]) [%]
+    :param eta_mc_x, eta_mc_y: support points of main conversion efficiency [%]
+    :param E_loadchange_x, E_loadchange_y: support points of load change energy [%], [kWh]
+
+    :return: heatup_pct, eta_pct, eta_mc_pct, values ordered as E_CHANGE_FIELDS, E_balance
+    """
+    # 1.) State calculations prior to action
+    P_out_0_pct = _P_out_0_pct_kernel(heatup_0_pct, P_out_0, par)
+
+    # 2.) Calculation of new heatup and load state [%]
+    P_out_1_pct, heatup_1_pct, load_operation_time = _calc_P_change_kernel(
+        P_out_0_pct, heatup_0_pct, P_out_target_pct, ts, par)
+
+    # 3.) Efficiency calculation
+    if heatup_1_pct < 100:
+        eta_1_pct = par.eta_preparation
+        eta_mc_1_pct = 0.
+    else:
+        eta_1_pct = interp_scalar(P_out_1_pct, eta_x, eta_y)
+        eta_mc_1_pct = interp_scalar(P_out_1_pct, eta_mc_x, eta_mc_y)
+
+    # 4.) Energy Calculation
+    (E_in, E_in_mc, E_loss, E_in_sd1, E_in_sd2, E_out,
+     P_in, P_in_mc, P_loss, P_in_sd1, P_in_sd2, P_out) = _calc_E_change_kernel(
+        P_out_1_pct, P_out_0_pct, heatup_1_pct, load_operation_time, eta_1_pct, eta_mc_1_pct,
+        heatup_0_pct, P_in_0, P_in_mc_0, P_out_0, ts, par, E_loadchange_x, E_loadchange_y)
+
+    # 5.) Energy balance calculation
+    E_bulk1 = (heatup_1_pct - heatup_0_pct) / 100 * par.E_preparation_heat
+    E_bulk2 = (interp_scalar(P_out_1_pct, E_loadchange_x, E_loadchange_y) -
+               interp_scalar(P_out_0_pct, E_loadchange_x, E_loadchange_y))
+    E_balance = E_in_mc + E_in_sd1 + E_in_sd2 - E_out - E_loss - E_bulk1 - E_bulk2
+
+    return (heatup_1_pct, eta_1_pct, eta_mc_1_pct,
+            E_in, E_in_mc, E_loss, E_in_sd1, E_in_sd2, E_out,
+            P_in, P_in_mc, P_loss, P_in_sd1, P_in_sd2, P_out,
+            E_balance)
+
+
+@njit(cache=True, nogil=True)
+def conversion_trajectory(P_out_target_pct, heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, ts, par,
+                          eta_x, eta_y, eta_mc_x, eta_mc_y, E_loadchange_x, E_loadchange_y):
+    """
+    Sequence of conversion_step() calculations for an array of target loads [%] in a single
+    jit-compiled loop, each step starting from the state after the previous step.
+
+    :param P_out_target_pct: array of target loads [%]
+    :param heatup_0_pct, P_out_0, P_in_0, P_in_mc_0: state prior to first action
+    further parameters see conversion_step(), e.g. EnergyConversion.step_kernel_args()
+
+    :return: array (number of steps, len(STEP_FIELDS)), columns ordered as STEP_FIELDS
+    """
+    n = P_out_target_pct.shape[0]
+    out = np.empty((n, len(STEP_FIELDS)))
+
+    for i in range(n):
+        res = conversion_step(heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, P_out_target_pct[i], ts,
+                              par, eta_x, eta_y, eta_mc_x, eta_mc_y,
+                              E_loadchange_x, E_loadchange_y)
+        for j in range(len(STEP_FIELDS)):
+            out[i, j] = res[j]
+
+        # New state prior to next action
+        heatup_0_pct = out[i, _STEP_I_HEATUP]
+        P_out_0 = out[i, _STEP_I_P_OUT]
+        P_in_0 = out[i, _STEP_I_P_IN]
+        P_in_mc_0 = out[i, _STEP_I_P_IN_MC]
+
+    return out
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def conversion_trajectories(P_out_target_pct, heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, ts, par,
+                            eta_x, eta_y, eta_mc_x, eta_mc_y, E_loadchange_x, E_loadchange_y):
+    """
+    Independent conversion_trajectory() calculations for several components with identical
+    parameters (e.g. Monte Carlo studies), parallelized over components if numba is available.
+    Must not be called from another parallel kernel (nested parallelism).
+
+    :param P_out_target_pct: array (number of components, number of steps) of target loads [%]
+    :param heatup_0_pct, P_out_0, P_in_0, P_in_mc_0: arrays (number of components) of states
+        prior to first action
+    further parameters see conversion_step(), e.g. EnergyConversion.step_kernel_args()
+
+    :return: array (number of components, number of steps, len(STEP_FIELDS)), columns ordered
+        as STEP_FIELDS
+    """
+    m, n = P_out_target_pct.shape
+    out = np.empty((m, n, len(STEP_FIELDS)))
+
+    for k in prange(m):
+        out[k] = conversion_trajectory(P_out_target_pct[k], heatup_0_pct[k], P_out_0[k],
+                                       P_in_0[k], P_in_mc_0[k], ts, par, eta_x, eta_y,
+                                       eta_mc_x, eta_mc_y, E_loadchange_x, E_loadchange_y)
+
+    return out
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def conversion_steps(P_out_target_pct, heatup_0_pct, P_out_0, P_in_0, P_in_mc_0, ts, par,
+                     eta_x, eta_y, eta_mc_x, eta_mc_y, E_loadchange_x, E_loadchange_y):
+    """
+    Single conversion_step() for several components with identical parameters, states given as
+    arrays (struct of arrays, e.g. columns of a state buffer, see
+    EnergyConversion.export_state_into()). Parallelized over components if numba is available.
+    Must not be called from another parallel kernel (nested parallelism).
+
+    :param P_out_target_pct: array (number of components) of target loads [%]
+    :param heatup_0_pct, P_out_0, P_in_0, P_in_mc_0: arrays (number of components) of states
+        prior to action
+    further parameters see conversion_step(), e.g. EnergyConversion.step_kernel_args()
+
+    :return: array (number of components, len(STEP_FIELDS)), columns ordered as STEP_FIELDS
+    """
+    m = P_out_target_pct.shape[0]
+    out = np.empty((m, len(STEP_FIELDS)))
+
+    for k in prange(m):
+        res = conversion_step(heatup_0_pct[k], P_out_0[k], P_in_0[k], P_in_mc_0[k],
+                              P_out_target_pct[k], ts, par, eta_x, eta_y, eta_mc_x, eta_mc_y,
+                              E_loadchange_x, E_loadchange_y)
+        for j in range(len(STEP_FIELDS)):
+            out[k, j] = res[j]
+
+    return out
+
+
+@njit(cache=True)
+def _P_out_0_pct_kernel(heatup_0_pct, P_out_0, par):
+    """
+    Kernel of EnergyConversion._P_out_0_pct(), load [%] prior to action
+    """
+    if heatup_0_pct < 100:
+        return heatup_0_pct / 100 * par.P_out_min_pct
+    return P_out_0 / par.P_out_rated * 100
+
+
+@njit(cache=True)
+def _calc_P_change_kernel(P_out_pct, heatup_0_pct, P_out_target_pct, ts, par):
+    """
+    Kernel of EnergyConversion._calc_P_change()
+
+    :param P_out_pct: Load [%] prior to action (artificial load below operation, see
+        EnergyConversion.step_action())
+    :param heatup_0_pct: heatup state [%] prior to action
+    :param P_out_target_pct: Target load [%]
+    :param ts: timestep [min]
+    :param par: EConversionScalars
+
+    :return: P_out_pct, heatup_pct, load_operation_time
+    """
+    load_operation_time = 0  # min
+    heatup_pct = heatup_0_pct
+    # Minimum load with tolerance for target loads, targets above count as operation range [O]
+    P_out_min_pct = par.P_out_min_pct - TOL_PCT
+
+    # Positive load changes & load holding
+    # ---------------------------------------
+    if P_out_pct <= P_out_target_pct + TOL_PCT:
+
+        # [S->S]
+        if P_out_target_pct < P_out_min_pct:
+            P_out_pct = min(P_out_target_pct,
+                            P_out_pct + par.p_change_st_pct * ts)
+            heatup_pct = P_out_pct / par.P_out_min_pct * 100
+
+        # [S->O (potentially)]
+        elif (P_out_target_pct >= P_out_min_pct) and \
+                (P_out_pct < par.P_out_min_pct):
+
+            prep_delta_perc = (par.P_out_min_pct - P_out_pct)  # %pts to min. load
+            prep_time_min = prep_delta_perc / par.p_change_st_pct  # time to min. load
+            if prep_delta_perc <= par.p_change_st_pct * ts + TOL_PCT:  # --> "O" reached
+                P_out_pct = min(P_out_target_pct,
+                                par.P_out_min_pct + par.p_change_pos * (
+                                        ts - prep_time_min))
+                load_operation_time = ts - prep_time_min
+                heatup_pct = 100
+            else:  # --> "O" not reached
+                P_out_pct = P_out_pct + par.p_change_st_pct * ts
+                heatup_pct = P_out_pct / par.P_out_min_pct * 100
+
+        # [O->O]
+        elif (P_out_target_pct >= P_out_min_pct) and \
+                (P_out_pct >= par.P_out_min_pct):
+
+            P_out_pct = min(P_out_target_pct,
+                            P_out_pct + par.p_change_pos * ts)
+            load_operation_time = ts
+
+    # Negative load changes
+    # ---------------------------------------
+    elif P_out_pct > P_out_target_pct + TOL_PCT:
+        # [O->O]
+        if P_out_target_pct >= P_out_min_pct:
+            P_out_pct = max(P_out_target_pct,
+                            P_out_pct - par.p_change_neg * ts)
+            load_operation_time = ts
+
+        # [O->S(potentially)]
+        elif (P_out_target_pct < P_out_min_pct) and \
+                (P_out_pct >= par.P_out_min_pct):
+
+            load_delta_perc = (P_out_pct - par.P_out_min_pct)  # %pts to min load
+            unload_time_min = load_delta_perc / par.p_change_neg  # time to min load
+            if unload_time_min < ts:  # --> shutdown mode reached
+                P_out_pct = max(P_out_target_pct,
+                                par.P_out_min_pct - par.p_change_sd_pct * (
+                                        ts - unload_time_min))
+                heatup_pct = P_out_pct / par.P_out_min_pct * 100
+                load_operation_time = unload_time_min
+            else:  # --> shutdown mode not reached
+                P_out_pct = P_out_pct - par.p_change_neg * ts
+                load_operation_time = ts
+        # [S->S]
+        elif (P_out_target_pct < P_out_min_pct) and \
+                (P_out_pct < par.P_out_min_pct):
+
+            P_out_pct = max(P_out_target_pct,
+                            P_out_pct - par.p_change_sd_pct * ts)
+            heatup_pct = P_out_pct / par.P_out_min_pct * 100
+
+    return P_out_pct, heatup_pct, load_operation_time
+
+
+@njit(cache=True)
+def _calc_E_change_kernel(P_out_pct, P_out_0_pct, heatup_1_pct, load_operation_time,
+                          eta_1_pct, eta_mc_1_pct, heatup_0_pct, P_in_0, P_in_mc_0, P_out_0, ts,
+                          par, E_loadchange_x, E_loadchange_y):
+    """
+    Kernel of EnergyConversion._calc_E_change()
+
+    :param heatup_0_pct, P_in_0, P_in_mc_0, P_out_0: state prior to action
+    :param ts: timestep [min]
+    :param par: EConversionScalars
+    :param E_loadchange_x, E_loadchange_y: support points of load change energy [%], [kWh]
+
+    :return: E_in, E_in_mc, E_loss, E_in_sd1, E_in_sd2, E_out,
+             P_in, P_in_mc, P_loss, P_in_sd1, P_in_sd2, P_out
+    """
+    # Common factors of energy [kWh] and load [kW] conversions
+    inv_ts_h = 60 / ts  # 1 / timestep [h]
+    t_op_h_half = load_operation_time / 120  # half of load operation time [h], trapezoidal rule
+
+    # [NL->NL], P_out_pct >= P_out_0_pct
+    # (if required) Energy amount for 'holding prior idle state (loss compensation)'
+    if (heatup_1_pct < 100) and (P_out_pct >= P_out_0_pct - TOL_PCT):
+        # Parameters used repeatedly, bound locally
+        E_preparation = par.E_preparation
+        P_change_sd_ts_pct = par.p_change_sd_pct * ts  # max. cooldown during timestep [%]
+        heatup_change = (heatup_1_pct - heatup_0_pct) / 100
+
+        if abs(P_out_pct - (P_out_0_pct + par.p_change_st_pct * ts)) <= TOL_PCT:
+            # -> Maximum start speed
+            # Loss during pure startup is expected to be included in given E_preparation
+            # and therefore no additional compensation is required #IDEA
+            E_compens = 0
+            E_compens_loss = 0
+
+        elif P_out_pct - P_change_sd_ts_pct < 0:
+            # In low heatup state, compesation is neglected, which is
+            # sufficient for rule based control (as this is no reasonable target state),
+            # however needs to be refined for advanced control #IDEA
+            E_compens = 0
+            E_compens_loss = 0
+
+        elif abs(P_out_pct - P_out_0_pct) <= TOL_PCT:
+            # calculate compensation energy and loss of it (just for holding the state)
+            E_compens = (P_change_sd_ts_pct / par.P_out_min_pct) * E_preparation
+            E_compens_loss = E_compens
+
+        else:
+            # For all other startup targets, compesation is neglected, which is
+            # sufficient for rule based control (as this is no reasonable target state),
+            # however needs to be refined for advanced control #IDEA
+            E_compens = 0
+            E_compens_loss = 0
+
+        # Energy amount for 'changing heatup state'
+        E_startup = heatup_change * E_preparation
+        E_startup_loss = heatup_change * par.E_preparation_loss
+
+        E_startup_combined = E_compens + E_startup
+
+        # State variables
+        E_in_mc_1 = 0
+        E_loss_1 = E_compens_loss + E_startup_loss
+        P_in_mc_1 = 0
+        P_loss_1 = E_loss_1 * inv_ts_h
+
+        E_in_sd1_1 = par.split_P_sd1 * E_startup_combined
+        E_in_sd2_1 = par.split_P_sd2 * E_startup_combined
+
+        P_in_sd1_1 = E_in_sd1_1 * inv_ts_h
+        P_in_sd2_1 = E_in_sd2_1 * inv_ts_h
+
+        # No output energy & load for heatup_pct < 100
+        E_out_1 = 0
+        P_out_1 = 0
+
+    # [xx->NL] P_out_pct < P_out_0_pct
+    elif (heatup_1_pct < 100) and (P_out_pct < P_out_0_pct - TOL_PCT):
+
+        # If required calculate operating portion (.._op) of input energy
+        if heatup_0_pct == 100:
+            E_in_op = (P_in_0 + par.P_in_min) * t_op_h_half
+
+            # Main conversion
+            E_in_mc_op = (P_in_mc_0 + par.P_in_mc_min) * t_op_h_half
+
+            # Load Change
+            E_loadchange_op = (interp_scalar(P_out_pct, E_loadchange_x, E_loadchange_y) -
+                               interp_scalar(P_out_0_pct, E_loadchange_x, E_loadchange_y))
+
+            # Secondary Energy
+            E_in_sd_op = E_in_op - E_in_mc_op + E_loadchange_op
+            E_in_sd1_op = par.split_P_sd1 * E_in_sd_op
+            E_in_sd2_op = par.split_P_sd2 * E_in_sd_op
+
+            E_out = (P_out_0 + par.P_out_min) * t_op_h_half
+            E_loss_op = E_in_op - E_out
+        else:
+            E_in_mc_op = 0
+            E_in_sd1_op = 0
+            E_in_sd2_op = 0
+            E_loss_op = 0
+            E_out = 0
+
+        # Coast down portion
+        coastdown_time = ts - load_operation_time
+        inv_coastdown_time_h = 60 / coastdown_time
+        P_out_cooldownst_pct = min(P_out_0_pct, par.P_out_min_pct)  # PStart of coast down
+        # (Hypothetically) max. cooldown during give time:
+        diff_cooldown_max_pct = min(par.p_change_sd_pct * coastdown_time,
+                                    P_out_cooldownst_pct)
+
+        # If required calculate energy amount for coast down ( for superposed energy input)
+        if P_out_pct > P_out_cooldownst_pct - diff_cooldown_max_pct:
+            diff_load_perc = P_out_pct - (P_out_cooldownst_pct - diff_cooldown_max_pct)
+            E_diff = diff_load_perc / par.P_out_min_pct * par.E_preparation
+            E_in_sd1_cd = par.split_P_sd1 * E_diff
+            E_in_sd2_cd = par.split_P_sd2 * E_diff
+
+        else:
+            diff_load_perc = 0
+            E_in_sd1_cd = 0
+            E_in_sd2_cd = 0
+
+        E_loss_cd = (diff_cooldown_max_pct /
+                     par.P_out_min_pct) * par.E_preparation_heat + \
+                    (diff_load_perc / par.P_out_min_pct) * par.E_preparation_loss
+
+        # state variables
+        E_in_mc_1 = E_in_mc_op
+        E_loss_1 = E_loss_op + E_loss_cd
+        P_in_mc_1 = 0
+        P_loss_1 = E_loss_cd * inv_coastdown_time_h
+
+        E_in_sd1_1 = E_in_sd1_op + E_in_sd1_cd
+        E_in_sd2_1 = E_in_sd2_op + E_in_sd2_cd
+
+        E_out_1 = E_out
+        P_out_1 = 0
+
+        # Power at end of time step is mean energy of coast down, not inluding prior load
+        # operation
+        P_in_sd1_1 = E_in_sd1_cd * inv_coastdown_time_h
+        P_in_sd2_1 = E_in_sd2_cd * inv_coastdown_time_h
+
+    else:  # [xx->L] Load Operation
+        # Energy calculations
+        P_out = par.P_out_rated * (P_out_pct / 100)
+
+        E_out = (max(P_out_0, par.P_out_min) + P_out) * t_op_h_half
+
+        P_in = P_out / (eta_1_pct / 100)
+        P_in_mc = P_out / (eta_mc_1_pct / 100)
+
+        # If required calculate starting portion of input energy
+        if heatup_0_pct < 100:
+            # Startup phase
+            E_in_hp = ((heatup_1_pct - heatup_0_pct) / 100 * par.E_preparation)
+            E_loss_hp = E_in_hp * ((100 - par.eta_preparation) / 100)
+            E_in_sd1_hp = par.split_P_sd1 * E_in_hp
+            E_in_sd2_hp = par.split_P_sd2 * E_in_hp
+
+        else:
+            E_loss_hp = 0
+            E_in_sd1_hp = 0
+            E_in_sd2_hp = 0
+
+        # Operating Phase
+        E_in_op = (max(P_in_0, par.P_in_min) + P_in) * t_op_h_half
+        E_in_mc_op = (max(P_in_mc_0, par.P_in_mc_min) + P_in_mc) * t_op_h_half
+        # Load Change
+        E_loadchange_op = (interp_scalar(P_out_pct, E_loadchange_x, E_loadchange_y) -
+                           interp_scalar(P_out_0_pct, E_loadchange_x, E_loadchange_y))
+
+        E_in_sd_op = E_in_op - E_in_mc_op + E_loadchange_op
+        E_in_sd1_op = par.split_P_sd1 * E_in_sd_op
+        E_in_sd2_op = par.split_P_sd2 * E_in_sd_op
+        E_loss_op = E_in_op - E_out
+
+        # New state variables
+        E_in_mc_1 = E_in_mc_op
+        E_in_sd1_1 = E_in_sd1_op + E_in_sd1_hp
+        E_in_sd2_1 = E_in_sd2_op + E_in_sd2_hp
+        E_out_1 = E_out
+        E_loss_1 = E_loss_op + E_loss_hp
+
+        P_in_mc_1 = P_in_mc
+        P_in_sd = P_in - P_in_mc
+        P_in_sd1_1 = P_in_sd * par.split_P_sd1
+        P_in_sd2_1 = P_in_sd * par.split_P_sd2
+        P_loss_1 = P_in - P_out
+        P_out_1 = P_out
+
+    # Summation of total input energy and load
+    E_in_1 = E_in_mc_1 + E_in_sd1_1 + E_in_sd2_1
+    P_in_1 = P_in_mc_1 + P_in_sd1_1 + P_in_sd2_1
+
+    return (E_in_1, E_in_mc_1, E_loss_1, E_in_sd1_1, E_in_sd2_1, E_out_1,
+            P_in_1, P_in_mc_1, P_loss_1, P_in_sd1_1, P_in_sd2_1, P_out_1)
+
+
+def _specialize_P_in_mc_from_P_out_status(conv_par: EConversionParams):
+    """
+    Creates function for EnergyConversion.P_in_mc_from_P_out_status() with all required
+    parameters bound as constants of the closure (no attribute lookups on call).
+    Parameters are read once, later changes of conv_par are not considered.
+    """
+    P_out_min = conv_par.P_out_min
+    P_out_rated = conv_par.P_out_rated
+    eta_mc_kW_ip = conv_par.eta_mc_kW_ip
+
+    def P_in_mc_from_P_out_status(output_load):
+        # Check if input_load is above required minimum
+        if output_load < P_out_min:
+            return float('nan'), -1
+        elif output_load > P_out_rated:
+            return float('nan'), 1
+        else:
+            # Efficiency interpolated directly on output load [kW], no conversion to [%]
+            return output_load * 100 / eta_mc_kW_ip(output_load), 0
+
+    return P_in_mc_from_P_out_status
+
+
+def _specialize_action_for_P_in_mc_target_status(conv_par: EConversionParams):
+    """
+    Creates function returning action and status for EnergyConversion.action_for_P_in_mc_target()
+    with all required parameters bound as constants of the closure (no attribute lookups on
+    call), see action_for_P_in_mc_target_status_kernel() for status values.
+    Parameters are read once, later changes of conv_par are not considered.
+    """
+    P_in_mc_min = conv_par.P_in_mc_min
+    P_in_mc_max = conv_par.P_in_mc_max
+    P_out_rated = conv_par.P_out_rated
+    eta_mc_in_kW_ip = conv_par.eta_mc_in_kW_ip
+
+    def action_for_P_in_mc_target_status(input_load):
+        if input_load < P_in_mc_min:
+            return float('nan'), -1
+        elif input_load > P_in_mc_max:
+            return float('nan'), 1
+        else:
+            P_out = input_load * eta_mc_in_kW_ip(input_load) / 100
+            return P_out / P_out_rated, 0
+
+    return action_for_P_in_mc_target_status
+
+
+@njit(cache=True)
+def P_in_mc_from_P_out_status_kernel(output_load, par, eta_mc_kW_x, eta_mc_kW_y):
+    """
+    Kernel of EnergyConversion.P_in_mc_from_P_out_status(), can be called from jit-compiled
+    (outer) loops, e.g. optimizers:
+
+        par = conv.par
+        res = P_in_mc_from_P_out_status_kernel(P_out, par.scalars,
+                                               par.eta_mc_kW_ip.x, par.eta_mc_kW_ip.y)
+
+    :param output_load: Output load [kW]
+    :param par: EConversionScalars
+    :param eta_mc_kW_x, eta_mc_kW_y: support points of main conversion efficiency
+                                     eta(output load [kW]) [%]
+    :return: main conversion input load [kW] (nan, if status != 0), status (see
+             EnergyConversion.P_in_mc_from_P_out_status())
+    """
+    if output_load < par.P_out_min:
+        return np.nan, -1
+    elif output_load > par.P_out_rated:
+        return np.nan, 1
+    return output_load * 100 / interp_scalar(output_load, eta_mc_kW_x, eta_mc_kW_y), 0
+
+
+@njit(cache=True)
+def action_for_P_in_mc_target_status_kernel(input_load, par, eta_mc_in_kW_x, eta_mc_in_kW_y):
+    """
+    Kernel of EnergyConversion.action_for_P_in_mc_target() without raising an error for input
+    loads outside of operation range, can be called from jit-compiled (outer) loops.
+
+    :param input_load: Main conversion input load [kW]
+    :param par: EConversionScalars
+    :param eta_mc_in_kW_x, eta_mc_in_kW_y: support points of main conversion efficiency
+                                           eta(input load [kW]) [%]
+    :return: action [0,1] (nan, if status != 0),
+             status: 0: valid, -1: below minimum input load, 1: above maximum input load
+    """
+    if input_load < par.P_in_mc_min:
+        return np.nan, -1
+    elif input_load > par.P_in_mc_max:
+        return np.nan, 1
+    P_out = input_load * interp_scalar(input_load, eta_mc_in_kW_x, eta_mc_in_kW_y) / 100
+    return P_out / par.P_out_rated, 0
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _P_in_mc_from_P_out_batch(output_loads, par, eta_mc_kW_x, eta_mc_kW_y, input_mc_loads):
+    """
+    Kernel of EnergyConversion.P_in_mc_from_P_out_batch(), writes into input_mc_loads.
+    Must not be called from another parallel kernel (nested parallelism).
+    """
+    for i in prange(output_loads.shape[0]):
+        input_mc_loads[i] = P_in_mc_from_P_out_status_kernel(output_loads[i], par,
+                                                             eta_mc_kW_x, eta_mc_kW_y)[0]
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _action_for_P_in_mc_target_batch(input_loads, par, eta_mc_in_kW_x, eta_mc_in_kW_y, actions):
+    """
+    Kernel of EnergyConversion.action_for_P_in_mc_target_batch(), writes into actions.
+    Must not be called from another parallel kernel (nested parallelism).
+    """
+    for i in prange(input_loads.shape[0]):
+        actions[i] = action_for_P_in_mc_target_status_kernel(input_loads[i], par,
+                                                             eta_mc_in_kW_x, eta_mc_in_kW_y)[0]
 
 
 if __name__ == "__main__":
@@ -1,8 +1,8 @@
 """
 Energy Storage, Battery System
 """
-from dataclasses import dataclass
-import copy
+from dataclasses import dataclass, fields, replace
+from operator import attrgetter
 
 from energysys_components.energy_carrier import ECarrier
 
@@ -52,6 +52,11 @@ class StorageState:
     errorcode: int = 0  # for passing different errors
 
 
+# Fixed order of state values in tuples, e.g. EnergyStorage.reset()
+STATE_FIELDS = tuple(f.name for f in fields(StorageState))
+_get_state_values = attrgetter(*STATE_FIELDS)
+
+
 class EnergyStorage:
     """
     Energy storage class
@@ -69,8 +74,11 @@ class EnergyStorage:
 
         self.par = stor_par
         self.ts = ts
-        cop = copy.deepcopy(stor_state)
+        # Info: StorageState holds only floats/ints, shallow copy equals deep copy
+        cop = replace(stor_state)
         self.state_initial = cop
+        # Frozen field values of initial state, reset() builds a fresh state from these
+        self._state_initial_fields = _get_state_values(cop)
         self.state = stor_state
 
     def step_action(self, E_req: float):
@@ -125,9 +133,12 @@ class EnergyStorage:
         """
         Reset to initial state
         (e.g. for ML/RL-Algorithms)
+
+        Info: New state is created from field values cached in __init__(),
+              later changes of self.state_initial are not considered.
         :return:
         """
-        self.state = copy.deepcopy(self.state_initial)
+        self.state = StorageState(*self._state_initial_fields)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
+from dataclasses import replace
 import pandas as pd
 import plotly.graph_objects as go
-import copy
 import numpy as np
-from src.energysys_components.energy_conversion import EConversionState, EnergyConversion
+from src.energysys_components.energy_conversion import (EConversionState, EnergyConversion,
+                                                         STATE_FIELDS)
 from src.energysys_components.component_definition import PEM, Cracker
 
 # Select component
@@ -13,20 +14,21 @@ full_load_state = EConversionState(P_in=2000,
                                    heatup_pct=100)
 
 if __name__ == "__main__":
-    # Result DataFrame Initialization
-    state_parms = [a for a in dir(EConversionState()) if not a.startswith('__')]
-    df1 = pd.DataFrame(columns=state_parms)
-    df1.loc[0] = vars(EConversionState())
-
     # Run different stationary cases for target output load
     targets = np.linspace(component.P_out_min_pct / 100, 1., 100)
 
+    # Result buffer, first row: initial state
+    buf = np.empty((len(targets) + 1, len(STATE_FIELDS)))
+    buf[0] = [getattr(EConversionState(), name) for name in STATE_FIELDS]
+
     for ct, t in enumerate(targets):
         # Initialization of component
         C1_state = EConversionState()
-        C1 = EnergyConversion(component, copy.deepcopy(C1_state), ts=1)
+        C1 = EnergyConversion(component, replace(C1_state), ts=1)
         C1.step_action_stationary(t)
-        df1.loc[ct + 1] = vars(C1.state)
+        C1.export_state_into(buf, ct + 1)
+
+    df1 = pd.DataFrame(buf, columns=STATE_FIELDS)
 
     # Create traces
     fig = go.Figure()
@@ -2,9 +2,10 @@
 Simple EnergyConversion()-Tests
 """
 
+from dataclasses import fields, replace
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-import copy
 from src.energysys_components.energy_conversion import EConversionState, EnergyConversion
 from src.energysys_components.component_definition import SOFC
 
@@ -16,10 +17,8 @@ full_load_state = EConversionState(P_in=2000,
                                    heatup_pct=100)
 
 if __name__ == "__main__":
-    # Result DataFrame Initialization
-    state_parms = [a for a in dir(EConversionState()) if not a.startswith('__')]
-    df1 = pd.DataFrame(columns=state_parms)
-    df1.loc[0] = vars(EConversionState())
+    # Result DataFrame columns
+    state_parms = [f.name for f in fields(EConversionState)]
 
     # Run different stationary cases for target output load
     targets = [0,
@@ -34,19 +33,20 @@ if __name__ == "__main__":
 
     for target in targets:
         # Initialization of component
-        C1 = EnergyConversion(component, copy.deepcopy(off_state), ts=1)
-        for t in range(ts):
-            print(t)
-            if t <= 90:
-                C1.step_action(target)
-            else:
-                C1.step_action(0)
-            df1.loc[t + 1] = vars(C1.state)
+        C1 = EnergyConversion(component, replace(off_state), ts=1)
+
+        # Target load until t=90, then shutdown; all time steps in one call
+        actions = np.where(np.arange(ts) <= 90, target, 0.)
+        res = C1.step_action_sequence(actions)
+
+        # Result DataFrame from result columns, states not calculated remain 0
+        df1 = pd.DataFrame(res, index=range(1, ts + 1)).reindex(columns=state_parms,
+                                                                 fill_value=0)
 
         # Create traces
         fig = go.Figure()
         for cl in df1.columns:
-            fig.add_trace(go.Scatter(x=df1.index[1:], y=df1[cl][1:],
+            fig.add_trace(go.Scatter(x=df1.index, y=df1[cl],
                                      mode='lines',
                                      name=cl))
             fig.update_layout(title=f"Target,rel: {target}")
@@ -0,0 +1,126 @@
+"""
+Linear interpolation helpers
+"""
+from bisect import bisect_right
+import numpy as np
+from energysys_components.various.jit import njit
+
+
+class LinearInterpolator:
+    """
+    Piecewise linear interpolation y(x) on given support points.
+
+    Values outside of support points are clamped to first and last value of y
+    (equivalent to interp1d(..., kind='linear', bounds_error=False, fill_value=(y[0], y[-1]))).
+    Support points are stored as numpy arrays, sorted by x.
+    """
+
+    def __init__(self, x, y):
+        """
+        :param x: list or array of support points
+        :param y: list or array of values at support points
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        order = np.argsort(x, kind='stable')
+        self.x = x[order]
+        self.y = y[order]
+
+        # Inverse step width for direct index computation, if support points are exactly
+        # equally spaced, otherwise 0 (no tolerance, nearly equal spacing is not uniform)
+        steps = np.diff(self.x)
+        self.dx_inv = 1 / steps[0] if (len(steps) > 0 and steps[0] > 0 and
+                                       np.all(steps == steps[0])) else 0
+
+        # Support points and slopes of segments as lists of Python floats for scalar evaluation
+        self._x_list = self.x.tolist()
+        self._y_list = self.y.tolist()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._slope_list = (np.diff(self.y) / steps).tolist()
+
+    def __call__(self, x_new):
+        """
+        :param x_new: scalar or array
+        :return: float for scalar input (float, int), else numpy array
+        """
+        if isinstance(x_new, (float, int)):
+            return self._interp_scalar(x_new)
+        return np.interp(x_new, self.x, self.y)
+
+    def _interp_scalar(self, x_new: float) -> float:
+        """
+        Scalar interpolation with binary search on lists and precomputed slopes, avoids
+        overhead of np.interp() call. Same arithmetic as np.interp().
+        """
+        x = self._x_list
+        y = self._y_list
+        if x_new != x_new:  # nan
+            return x_new
+        elif x_new <= x[0]:
+            return y[0]
+        elif x_new >= x[-1]:
+            return y[-1]
+
+        j = bisect_right(x, x_new) - 1
+        if x[j] == x_new:
+            return y[j]
+        return self._slope_list[j] * (x_new - x[j]) + y[j]
+
+
+@njit(cache=True)
+def interp_scalar(x_new, x, y):
+    """
+    Scalar linear interpolation with binary search for jit-compiled kernels,
+    same arithmetic and clamping as np.interp().
+
+    :param x_new: float
+    :param x: array of (sorted) support points
+    :param y: array of values at support points
+    """
+    n = x.shape[0]
+    if x_new != x_new:  # nan
+        return x_new
+    elif x_new <= x[0]:
+        return y[0]
+    elif x_new >= x[n - 1]:
+        return y[n - 1]
+
+    # Binary search for j with x[j] <= x_new < x[j+1]
+    lo = 0
+    hi = n - 1
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if x[mid] <= x_new:
+            lo = mid
+        else:
+            hi = mid
+    if x[lo] == x_new:
+        return y[lo]
+    slope = (y[lo + 1] - y[lo]) / (x[lo + 1] - x[lo])
+    return slope * (x_new - x[lo]) + y[lo]
+
+
+def interp_uniform(x, xp, dx_inv, yp):
+    """
+    Vectorized linear interpolation for exactly equally spaced support points xp with inverse
+    step width dx_inv. The segment of each value is computed directly instead of by binary
+    search, interpolation uses the same arithmetic as np.interp() (identical results).
+    Values outside of support points are clamped to first and last value of yp, nan values
+    stay nan.
+    """
+    n = len(xp)
+    # Info: Invalid cast of nan positions is corrected by clipping, result is nan by x
+    with np.errstate(invalid='ignore'):
+        idx = ((x - xp[0]) * dx_inv).astype(np.intp)
+    np.clip(idx, 0, n - 2, out=idx)
+    # Correction of computed segment for rounding errors at segment borders
+    idx -= x < xp[idx]
+    idx += x >= xp[idx + 1]
+    np.clip(idx, 0, n - 2, out=idx)
+
+    x_j = xp[idx]
+    y_j = yp[idx]
+    res = (yp[idx + 1] - y_j) / (xp[idx + 1] - x_j) * (x - x_j) + y_j
+    res[x <= xp[0]] = yp[0]
+    res[x >= xp[-1]] = yp[-1]
+    return res
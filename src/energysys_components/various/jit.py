@@ -0,0 +1,28 @@
+"""
+Optional just-in-time compilation with numba
+
+If numba is not installed, decorated functions are executed as plain Python functions
+and prange() falls back to range().
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Fallback for numba.njit(), returns decorated function unchanged.
+        Supports usage with and without arguments, e.g. @njit and @njit(cache=True)
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
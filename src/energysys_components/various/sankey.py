@@ -5,7 +5,6 @@ Functions for generation of component Sankey diagram
 import plotly.graph_objects as go
 import pandas as pd
 
-from energysys_components.component_definition import PEM
 from energysys_components.energy_carrier import Loss
 from energysys_components.energy_conversion import EConversionParams
 
@@ -91,6 +90,9 @@ def sankey_component_input_dicts(res: pd.Series, comp: EConversionParams) -> (di
 
 
 if __name__ == "__main__":
+    # Example component, imported here to avoid building all component definitions on import
+    from energysys_components.component_definition import PEM
+
     # Create dummy results
     comp = PEM
 